@@ -5,12 +5,161 @@ This module handles all configuration loading, validation, and default values.
 It provides a centralized way to manage environment variables and application settings.
 """
 
+import calendar
+import functools
 import logging
 import os
-from datetime import datetime
+from datetime import datetime, timezone
+from typing import Any, Callable
 
 from dotenv import load_dotenv
 
+try:
+    from ciso8601 import parse_datetime as _parse_datetime
+except ImportError:  # ciso8601 is an optional speed-up
+
+    def _parse_datetime(value: str) -> datetime:
+        # datetime.fromisoformat is implemented in C and handles date-only
+        # values too. Older Python versions don't understand the "Z" suffix,
+        # so spell it out as an explicit UTC offset before parsing.
+        if value.endswith("Z"):
+            value = value[:-1] + "+00:00"
+        try:
+            return datetime.fromisoformat(value)
+        except ValueError:
+            # Before Python 3.11 fromisoformat only accepts 3 or 6 fractional
+            # digits, while strptime's %f takes anywhere from 1 to 6
+            return datetime.strptime(value, "%Y-%m-%dT%H:%M:%S.%f%z")
+
+
+# Shared UTC tzinfo for all timezone-aware datetimes in this module
+_UTC = timezone.utc
+
+# Log level names accepted by setup_logging
+_LOG_LEVELS = {
+    "DEBUG": logging.DEBUG,
+    "INFO": logging.INFO,
+    "WARNING": logging.WARNING,
+    "ERROR": logging.ERROR,
+    "CRITICAL": logging.CRITICAL,
+}
+
+# Configuration rules checked by Config._validate_config, in order, as
+# (setting name, predicate that holds for valid values, error message).
+_VALIDATION_RULES: tuple[tuple[str, Callable[[Any], bool], str], ...] = (
+    (
+        "api_key",
+        lambda value: len(value) >= 10,
+        "API key appears to be too short. Please verify your FIREFLIES_API_KEY.",
+    ),
+    (
+        "months_to_fetch",
+        lambda value: 1 <= value <= 12,
+        "MONTHS_TO_FETCH must be between 1 and 12.",
+    ),
+    (
+        "max_transcripts_per_query",
+        lambda value: 1 <= value <= 50,
+        "MAX_TRANSCRIPTS_PER_QUERY must be between 1 and 50 (API limit).",
+    ),
+    (
+        "max_concurrent_requests",
+        lambda value: 1 <= value <= 20,
+        "MAX_CONCURRENT_REQUESTS must be between 1 and 20.",
+    ),
+    (
+        "api_requests_per_minute",
+        lambda value: value >= 0,
+        "API_REQUESTS_PER_MINUTE must be 0 (unlimited) or a positive number.",
+    ),
+    (
+        "api_base_url",
+        lambda value: value.startswith("https://"),
+        "API_BASE_URL must be a valid HTTPS URL.",
+    ),
+)
+
+# Whether the .env file has already been loaded in this process
+_DOTENV_LOADED = False
+
+
+def _load_dotenv_once() -> None:
+    """
+    Load the .env file into the process environment, at most once.
+
+    load_dotenv re-reads and re-parses the file on every call, so repeated
+    Config construction (tests, multiple CLI entry points) would otherwise
+    pay that cost each time.
+    """
+    global _DOTENV_LOADED
+    if not _DOTENV_LOADED:
+        load_dotenv()
+        _DOTENV_LOADED = True
+
+
+def format_iso_datetime(value: datetime) -> str:
+    """
+    Format a UTC datetime as "YYYY-MM-DDTHH:MM:SS.ffffffZ".
+
+    This is the timestamp format used for all Fireflies API date arguments.
+    Equivalent to strftime("%Y-%m-%dT%H:%M:%S.%fZ"), but assembled directly
+    so it skips strftime's format parsing and locale handling.
+
+    Args:
+        value: Datetime to format
+
+    Returns:
+        ISO 8601 timestamp with microseconds and a trailing "Z"
+    """
+    return (
+        f"{value.year:04d}-{value.month:02d}-{value.day:02d}"
+        f"T{value.hour:02d}:{value.minute:02d}:{value.second:02d}"
+        f".{value.microsecond:06d}Z"
+    )
+
+
+def parse_iso_datetime(value: str) -> datetime:
+    """
+    Parse an ISO 8601 timestamp into a timezone-aware UTC datetime.
+
+    Args:
+        value: Timestamp such as "2024-07-08T22:13:46.660Z" or "2024-01-01"
+
+    Returns:
+        Parsed datetime in UTC (values without an offset are assumed to be UTC)
+
+    Raises:
+        ValueError: If the string is not a valid ISO 8601 timestamp
+    """
+    parsed = _parse_datetime(value)
+
+    # Treat values without an offset as UTC and convert everything else, so
+    # all datetimes are aware and comparable.
+    if parsed.tzinfo is None:
+        return parsed.replace(tzinfo=_UTC)
+    return parsed.astimezone(_UTC)
+
+
+@functools.lru_cache(maxsize=32)
+def _validate_settings(settings: tuple[tuple[str, Any], ...]) -> None:
+    """
+    Check raw setting values against _VALIDATION_RULES.
+
+    Results are memoized on the values themselves, so constructing Config
+    repeatedly with the same environment only validates it once. Failures
+    are not cached and raise every time.
+
+    Args:
+        settings: (setting name, value) pairs
+
+    Raises:
+        ValueError: If any setting is invalid
+    """
+    values = dict(settings)
+    for name, is_valid, message in _VALIDATION_RULES:
+        if not is_valid(values[name]):
+            raise ValueError(message)
+
 
 class Config:
     """
@@ -22,22 +171,33 @@ class Config:
 
     def __init__(self):
         """Initialize configuration by loading environment variables."""
-        # Load environment variables from .env file
-        load_dotenv()
+        # Load environment variables from .env file, then take a single
+        # snapshot of the environment to read every setting from.
+        _load_dotenv_once()
+        env = dict(os.environ)
 
         # Core API configuration
-        self.api_key: str = self._get_required_env("FIREFLIES_API_KEY")
-        self.api_base_url: str = os.getenv(
+        self.api_key: str = self._get_required_env(env, "FIREFLIES_API_KEY")
+        self.api_base_url: str = env.get(
             "API_BASE_URL", "https://api.fireflies.ai/graphql"
         )
 
         # Output configuration
-        self.output_directory: str = os.getenv("OUTPUT_DIRECTORY", "transcripts")
+        self.output_directory: str = env.get("OUTPUT_DIRECTORY", "transcripts")
 
         # Query configuration (relative date-based)
-        self.months_to_fetch: int = int(os.getenv("MONTHS_TO_FETCH", "2"))
+        self.months_to_fetch: int = int(env.get("MONTHS_TO_FETCH", "2"))
         self.max_transcripts_per_query: int = int(
-            os.getenv("MAX_TRANSCRIPTS_PER_QUERY", "50")
+            env.get("MAX_TRANSCRIPTS_PER_QUERY", "50")
+        )
+
+        # Number of transcript detail requests allowed in flight at once
+        self.max_concurrent_requests: int = int(env.get("MAX_CONCURRENT_REQUESTS", "4"))
+
+        # Client-side request rate limit. The default matches the documented
+        # Business plan limit of 60 requests per minute; 0 disables it.
+        self.api_requests_per_minute: float = float(
+            env.get("API_REQUESTS_PER_MINUTE", "60")
         )
 
         # Optional absolute date range overrides (ISO 8601 strings).
@@ -48,17 +208,26 @@ class Config:
         # - 2024-01-01
         # - 2024-01-01T00:00:00Z
         # - 2024-01-01T00:00:00.000Z
-        self.from_date_override: str | None = os.getenv("FIREFLIES_FROM_DATE")
-        self.to_date_override: str | None = os.getenv("FIREFLIES_TO_DATE")
+        self.from_date_override: str | None = env.get("FIREFLIES_FROM_DATE")
+        self.to_date_override: str | None = env.get("FIREFLIES_TO_DATE")
+
+        # Run start time (UTC). Every "now" in the date range logic refers to
+        # this instant, so the window is stable for the lifetime of the run.
+        self.run_started_at: datetime = datetime.now(_UTC)
+
+        # Lazily computed caches for get_date_range / get_date_range_iso
+        self._date_range: tuple[datetime, datetime] | None = None
+        self._date_range_iso: tuple[str, str] | None = None
 
         # Validate configuration
         self._validate_config()
 
-    def _get_required_env(self, key: str) -> str:
+    def _get_required_env(self, env: dict[str, str], key: str) -> str:
         """
         Get a required environment variable with proper error handling.
 
         Args:
+            env: Snapshot of the process environment
             key: Environment variable name
 
         Returns:
@@ -67,7 +236,7 @@ class Config:
         Raises:
             ValueError: If the environment variable is not set or empty
         """
-        value = os.getenv(key)
+        value = env.get(key)
         if not value or value.strip() == "":
             raise ValueError(
                 f"Required environment variable '{key}' is not set or empty. "
@@ -82,25 +251,16 @@ class Config:
         Raises:
             ValueError: If any configuration value is invalid
         """
-        # Validate API key format (basic check)
-        if len(self.api_key) < 10:
-            raise ValueError(
-                "API key appears to be too short. Please verify your FIREFLIES_API_KEY."
-            )
-
-        # Validate months to fetch
-        if self.months_to_fetch < 1 or self.months_to_fetch > 12:
-            raise ValueError("MONTHS_TO_FETCH must be between 1 and 12.")
-
-        # Validate max transcripts per query
-        if self.max_transcripts_per_query < 1 or self.max_transcripts_per_query > 50:
-            raise ValueError(
-                "MAX_TRANSCRIPTS_PER_QUERY must be between 1 and 50 (API limit)."
+        _validate_settings(
+            (
+                ("api_key", self.api_key),
+                ("months_to_fetch", self.months_to_fetch),
+                ("max_transcripts_per_query", self.max_transcripts_per_query),
+                ("max_concurrent_requests", self.max_concurrent_requests),
+                ("api_requests_per_minute", self.api_requests_per_minute),
+                ("api_base_url", self.api_base_url),
             )
-
-        # Validate API base URL
-        if not self.api_base_url.startswith("https://"):
-            raise ValueError("API_BASE_URL must be a valid HTTPS URL.")
+        )
 
     def _parse_iso_datetime(self, value: str, var_name: str) -> datetime:
         """
@@ -120,30 +280,16 @@ class Config:
             var_name: Name of the environment variable (used in error messages)
 
         Returns:
-            Parsed datetime instance (naive, assumed to be UTC)
+            Parsed timezone-aware datetime in UTC (values without an
+            offset are assumed to be UTC)
 
         Raises:
             ValueError: If the string cannot be parsed in a supported format
         """
         value = value.strip()
 
-        # Try the most explicit "Z" suffixed formats first
         try:
-            if value.endswith("Z"):
-                # Try with microseconds, then without
-                try:
-                    return datetime.strptime(value, "%Y-%m-%dT%H:%M:%S.%fZ")
-                except ValueError:
-                    return datetime.strptime(value, "%Y-%m-%dT%H:%M:%SZ")
-
-            # Fallbacks: full ISO string or simple date-only string
-            try:
-                # datetime.fromisoformat handles many common ISO variants
-                return datetime.fromisoformat(value)
-            except ValueError:
-                # Allow simple "YYYY-MM-DD" date-only values
-                return datetime.strptime(value, "%Y-%m-%d")
-
+            return parse_iso_datetime(value)
         except ValueError as exc:
             raise ValueError(
                 f"Invalid datetime format for {var_name}: '{value}'. "
@@ -160,6 +306,20 @@ class Config:
            by FIREFLIES_FROM_DATE / FIREFLIES_TO_DATE (or "now" if TO is omitted).
         2. Otherwise, fall back to the relative MONTHS_TO_FETCH window.
 
+        "Now" is the run start time captured when the Config was created, and
+        the result is computed once and reused on subsequent calls.
+
+        Returns:
+            Tuple of (start_date, end_date) in UTC timezone
+        """
+        if self._date_range is None:
+            self._date_range = self._compute_date_range()
+        return self._date_range
+
+    def _compute_date_range(self) -> tuple[datetime, datetime]:
+        """
+        Compute the (start_date, end_date) tuple described in get_date_range.
+
         Returns:
             Tuple of (start_date, end_date) in UTC timezone
         """
@@ -175,7 +335,7 @@ class Config:
                     self.to_date_override, "FIREFLIES_TO_DATE"
                 )
             else:
-                to_dt = datetime.utcnow()
+                to_dt = self.run_started_at
 
             if from_dt > to_dt:
                 raise ValueError(
@@ -185,18 +345,18 @@ class Config:
             return from_dt, to_dt
 
         # Fallback: use the relative MONTHS_TO_FETCH window.
-        # End date is current time in UTC
-        end_date = datetime.utcnow()
-
-        # Start date is months_to_fetch months ago.
-        # Handle different month lengths properly.
-        start_date = end_date
-        for _ in range(self.months_to_fetch):
-            # Go back one month, handling year boundaries
-            if start_date.month == 1:
-                start_date = start_date.replace(year=start_date.year - 1, month=12)
-            else:
-                start_date = start_date.replace(month=start_date.month - 1)
+        # End date is the run start time in UTC
+        end_date = self.run_started_at
+
+        # Start date is months_to_fetch months ago. Work in a zero-based month
+        # count so year boundaries fall out of divmod, and clamp the day to
+        # the target month's length (e.g. March 31 -> February 28/29).
+        year, month_index = divmod(
+            end_date.year * 12 + end_date.month - 1 - self.months_to_fetch, 12
+        )
+        month = month_index + 1
+        day = min(end_date.day, calendar.monthrange(year, month)[1])
+        start_date = end_date.replace(year=year, month=month, day=day)
 
         return start_date, end_date
 
@@ -207,13 +367,16 @@ class Config:
         Returns:
             Tuple of (from_date, to_date) in ISO 8601 format
         """
-        start_date, end_date = self.get_date_range()
+        if self._date_range_iso is None:
+            start_date, end_date = self.get_date_range()
 
-        # Convert to ISO 8601 format as required by Fireflies API
-        from_date = start_date.strftime("%Y-%m-%dT%H:%M:%S.%fZ")
-        to_date = end_date.strftime("%Y-%m-%dT%H:%M:%S.%fZ")
+            # Convert to ISO 8601 format as required by Fireflies API
+            self._date_range_iso = (
+                format_iso_datetime(start_date),
+                format_iso_datetime(end_date),
+            )
 
-        return from_date, to_date
+        return self._date_range_iso
 
 
 def setup_logging(log_level: str = "INFO") -> logging.Logger:
@@ -225,14 +388,24 @@ def setup_logging(log_level: str = "INFO") -> logging.Logger:
 
     Returns:
         Configured logger instance
+
+    Raises:
+        ValueError: If log_level is not a recognised level name
     """
+    level = _LOG_LEVELS.get(log_level.upper())
+    if level is None:
+        raise ValueError(
+            f"Invalid log level '{log_level}'. "
+            f"Use one of: {', '.join(_LOG_LEVELS)}."
+        )
+
     # Create logger
     logger = logging.getLogger("fireflies_fetcher")
-    logger.setLevel(getattr(logging, log_level.upper()))
+    logger.setLevel(level)
 
     # Create console handler
     console_handler = logging.StreamHandler()
-    console_handler.setLevel(getattr(logging, log_level.upper()))
+    console_handler.setLevel(level)
 
     # Create formatter
     formatter = logging.Formatter(
@@ -9,12 +9,233 @@ import json
 import logging
 import time
 import re
-from typing import Any, Dict, List, Optional
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 import requests
 from requests.adapters import HTTPAdapter
+from urllib3.util import make_headers
 from urllib3.util.retry import Retry
 
+from config import format_iso_datetime, parse_iso_datetime
+
+try:
+    import orjson
+except ImportError:  # orjson is an optional speed-up
+    orjson = None
+
+# JSON encode/decode helpers for GraphQL payloads. orjson is several times
+# faster than the stdlib on large transcript responses; both variants work
+# on bytes, and orjson.JSONDecodeError subclasses json.JSONDecodeError.
+if orjson is not None:
+    _json_dumps = orjson.dumps
+    _json_loads = orjson.loads
+else:
+
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode("utf-8")
+
+    _json_loads = json.loads
+
+# GraphQL documents used by FirefliesClient. They never change, so they are
+# defined once here rather than rebuilt inside each method call.
+
+# Smallest possible authenticated request, used to check the API key
+_AUTH_CHECK_QUERY = "query { __typename }"
+
+_USER_QUERY = """
+query {
+    user {
+        user_id
+        email
+    }
+}
+"""
+
+_TRANSCRIPTS_QUERY = """
+query Transcripts($fromDate: DateTime, $toDate: DateTime, $limit: Int, $skip: Int) {
+    transcripts(
+        fromDate: $fromDate, toDate: $toDate, limit: $limit, skip: $skip
+    ) {
+        id
+        title
+        organizer_email
+        participants
+        fireflies_users
+        duration
+        dateString
+        date
+        transcript_url
+    }
+}
+"""
+
+# Optional sections of the transcript detail query. Callers can ask for a
+# subset of these to avoid downloading data they don't use; "sentences" in
+# particular dominates the response size for long meetings.
+_TRANSCRIPT_DETAIL_SECTIONS = {
+    "speakers": """
+        speakers {
+            id
+            name
+        }""",
+    "sentences": """
+        sentences {
+            text
+            speaker_name
+            start_time
+            end_time
+        }""",
+    "summary": """
+        summary {
+            action_items
+            keywords
+            outline
+        }""",
+}
+
+TRANSCRIPT_DETAIL_SECTIONS = frozenset(_TRANSCRIPT_DETAIL_SECTIONS)
+
+# Detail query documents already built, keyed by the included sections
+_transcript_detail_queries: Dict[frozenset, str] = {}
+
+# Batched detail query documents, keyed by (included sections, batch size)
+_transcript_batch_queries: Dict[Tuple[frozenset, int], str] = {}
+
+
+def _get_transcript_detail_fields(include: frozenset) -> str:
+    """
+    Return the transcript field selection for a set of optional sections.
+
+    Args:
+        include: Names from TRANSCRIPT_DETAIL_SECTIONS to request
+
+    Returns:
+        GraphQL selection set shared by the single and batched detail queries
+    """
+    sections = "".join(
+        fragment
+        for name, fragment in _TRANSCRIPT_DETAIL_SECTIONS.items()
+        if name in include
+    )
+    return f"""{{
+        id
+        title
+        organizer_email
+        participants
+        fireflies_users
+        duration
+        dateString
+        date
+        transcript_url{sections}
+    }}"""
+
+
+def _get_transcript_detail_query(include: frozenset) -> str:
+    """
+    Return the transcript detail query for a set of optional sections.
+
+    Args:
+        include: Names from TRANSCRIPT_DETAIL_SECTIONS to request
+
+    Returns:
+        GraphQL query string (built once per distinct section set)
+    """
+    query = _transcript_detail_queries.get(include)
+    if query is None:
+        query = f"""
+query Transcript($transcriptId: String!) {{
+    transcript(id: $transcriptId) {_get_transcript_detail_fields(include)}
+}}
+"""
+        _transcript_detail_queries[include] = query
+    return query
+
+
+def _get_transcript_batch_query(include: frozenset, count: int) -> str:
+    """
+    Return a query fetching `count` transcripts at once via field aliases.
+
+    Transcript i is selected as alias "t{i}" with its ID in variable "$id{i}".
+
+    Args:
+        include: Names from TRANSCRIPT_DETAIL_SECTIONS to request
+        count: Number of transcripts in the batch
+
+    Returns:
+        GraphQL query string (built once per section set and batch size)
+    """
+    key = (include, count)
+    query = _transcript_batch_queries.get(key)
+    if query is None:
+        fields = _get_transcript_detail_fields(include)
+        params = ", ".join(f"$id{i}: String!" for i in range(count))
+        selections = "".join(
+            f"\n    t{i}: transcript(id: $id{i}) {fields}" for i in range(count)
+        )
+        query = f"\nquery TranscriptBatch({params}) {{{selections}\n}}\n"
+        _transcript_batch_queries[key] = query
+    return query
+
+
+def _resolve_detail_sections(include: Optional[Iterable[str]]) -> frozenset:
+    """
+    Validate and normalize the sections requested from a detail query.
+
+    Args:
+        include: Section names, or None for all of them
+
+    Returns:
+        Frozen set of section names
+
+    Raises:
+        ValueError: If an unknown section is requested
+    """
+    if include is None:
+        return TRANSCRIPT_DETAIL_SECTIONS
+
+    sections = frozenset(include)
+    unknown = sections - TRANSCRIPT_DETAIL_SECTIONS
+    if unknown:
+        raise ValueError(f"Unknown transcript sections: {', '.join(sorted(unknown))}")
+    return sections
+
+
+def _split_date_range(
+    from_date: str, to_date: str, shards: int
+) -> List[Tuple[str, str]]:
+    """
+    Split an ISO 8601 date range into consecutive, equally sized sub-ranges.
+
+    Each sub-range ends one millisecond past the start of the next, so a
+    transcript created exactly on a boundary is returned by at least one of
+    them regardless of whether the API treats the bounds as inclusive.
+
+    Args:
+        from_date: Start date in ISO 8601 format
+        to_date: End date in ISO 8601 format
+        shards: Number of sub-ranges to produce
+
+    Returns:
+        List of (from_date, to_date) ISO 8601 string tuples
+    """
+    start = parse_iso_datetime(from_date)
+    end = parse_iso_datetime(to_date)
+    step = (end - start) / shards
+    overlap = timedelta(milliseconds=1)
+
+    ranges = []
+    for index in range(shards):
+        shard_start = start + step * index
+        shard_end = end if index == shards - 1 else shard_start + step + overlap
+        ranges.append(
+            (format_iso_datetime(shard_start), format_iso_datetime(shard_end))
+        )
+    return ranges
+
 
 class FirefliesAPIError(Exception):
     """Custom exception for Fireflies API specific errors."""
@@ -38,12 +259,76 @@ class FirefliesAPIError(Exception):
         self.response_data = response_data
 
 
+class FirefliesAuthError(FirefliesAPIError):
+    """Raised when the Fireflies API rejects the API key."""
+
+
+class RateLimiter:
+    """
+    Thread-safe token bucket limiting how often requests may start.
+
+    Tokens refill continuously at `rate` per `per` seconds, up to `burst`
+    tokens. acquire() takes a token, sleeping only when none is available,
+    so callers that are already slower than the limit never wait.
+    """
+
+    def __init__(self, rate: float, per: float = 1.0, burst: int = 1):
+        """
+        Initialize the rate limiter.
+
+        Args:
+            rate: Number of requests allowed per period
+            per: Length of the period in seconds
+            burst: Maximum number of tokens that can accumulate while idle
+
+        Raises:
+            ValueError: If rate, per or burst is not positive
+        """
+        if rate <= 0 or per <= 0 or burst < 1:
+            raise ValueError("rate, per and burst must be positive")
+
+        self._interval = per / rate  # Seconds needed to refill one token
+        self._burst = burst
+        self._tokens = float(burst)
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self, stop: Optional[threading.Event] = None) -> None:
+        """
+        Block until a token is available, then consume it.
+
+        Args:
+            stop: Event that ends the wait early when set; callers check it
+                afterwards to tell the two apart
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self._burst, self._tokens + (now - self._updated_at) / self._interval
+            )
+            self._updated_at = now
+
+            # Reserve the token now (possibly going negative) so concurrent
+            # callers queue up behind each other instead of all waking at once.
+            self._tokens -= 1
+            wait_seconds = -self._tokens * self._interval
+
+        if wait_seconds > 0:
+            if stop is None:
+                time.sleep(wait_seconds)
+            else:
+                stop.wait(wait_seconds)
+
+
 class FirefliesClient:
     """
     Client for interacting with the Fireflies.ai GraphQL API.
 
     This class provides methods to authenticate, query transcripts, and handle
     API responses with proper error handling and retry logic.
+
+    A single instance (and its underlying requests session) is safe to share
+    across threads; use get_client to reuse one per API key.
     """
 
     def __init__(
@@ -51,6 +336,9 @@ class FirefliesClient:
         api_key: str,
         base_url: str = "https://api.fireflies.ai/graphql",
         logger: Optional[logging.Logger] = None,
+        key_validated: bool = False,
+        requests_per_minute: Optional[float] = None,
+        session: Optional[requests.Session] = None,
     ):
         """
         Initialize the Fireflies API client.
@@ -59,20 +347,58 @@ class FirefliesClient:
             api_key: Fireflies API key for authentication
             base_url: Base URL for the Fireflies GraphQL API
             logger: Logger instance for logging operations
+            key_validated: Skip the basic API key format check because the
+                caller (e.g. Config) has already performed it
+            requests_per_minute: Maximum request rate across all threads
+                using this client (None or 0 for no client-side limit)
+            session: Existing requests session to send requests through. Its
+                connection pool and retry adapters are kept; only the
+                Fireflies headers are added. A pooled session with retries
+                is created when omitted.
         """
         self.api_key = api_key
         self.base_url = base_url
         self.logger = logger or logging.getLogger(__name__)
 
-        # Create session with retry strategy
-        self.session = self._create_session()
+        # Pace requests ahead of time rather than waiting for rate limit errors
+        self.rate_limiter = (
+            RateLimiter(requests_per_minute, per=60.0) if requests_per_minute else None
+        )
+
+        # Set by stop() to cut short rate limit waits in other threads
+        self._stop_event = threading.Event()
+
+        # Create session with retry strategy, or adopt the caller's session
+        if session is None:
+            self.session = self._create_session()
+        else:
+            session.headers.update(self._default_headers())
+            self.session = session
 
         # Validate API key format (basic validation only)
-        if not self.api_key or len(self.api_key.strip()) < 10:
+        if not key_validated and (not self.api_key or len(self.api_key.strip()) < 10):
             raise FirefliesAPIError("API key appears to be invalid or too short")
 
         self.logger.info("FirefliesClient initialized successfully")
 
+    def _default_headers(self) -> Dict[str, str]:
+        """
+        Build the headers sent with every request.
+
+        Transcript responses are highly compressible, so every encoding
+        urllib3 can decode is advertised (brotli is included automatically
+        when the brotli package is installed).
+
+        Returns:
+            Header name to value mapping
+        """
+        return {
+            "Content-Type": "application/json",
+            "Authorization": f"Bearer {self.api_key}",
+            "User-Agent": "Fireflies-Meeting-Fetcher/1.0",
+            "Accept-Encoding": make_headers(accept_encoding=True)["accept-encoding"],
+        }
+
     def _create_session(self) -> requests.Session:
         """
         Create a requests session with retry strategy and proper headers.
@@ -81,65 +407,119 @@ class FirefliesClient:
             Configured requests session
         """
         session = requests.Session()
+        session.headers.update(self._default_headers())
 
-        # Set default headers
-        session.headers.update(
-            {
-                "Content-Type": "application/json",
-                "Authorization": f"Bearer {self.api_key}",
-                "User-Agent": "Fireflies-Meeting-Fetcher/1.0",
-            }
-        )
-
-        # Configure retry strategy
+        # Configure retry strategy. This is the only throttling between
+        # requests: urllib3 backs off on 429/5xx responses and honours any
+        # Retry-After header the server sends.
         retry_strategy = Retry(
-            total=3,  # Total number of retries
+            total=5,  # Total number of retries
             status_forcelist=[429, 500, 502, 503, 504],  # HTTP status codes to retry
-            allowed_methods=["POST"],  # Only retry POST requests
-            backoff_factor=1,  # Exponential backoff factor
+            allowed_methods=frozenset(["POST"]),  # Only retry POST requests
+            backoff_factor=0.5,  # Exponential backoff factor
+            backoff_jitter=0.2,  # Random jitter (seconds) added to each backoff
+            respect_retry_after_header=True,  # Wait as long as the server asks
             raise_on_status=False,  # Don't raise exceptions on retry
         )
 
-        adapter = HTTPAdapter(max_retries=retry_strategy)
+        # Size the connection pool for concurrent requests (parallel detail
+        # batches, sharded list fetching) so each gets a kept-alive
+        # connection. With pool_block=False an unexpected burst opens extra
+        # connections instead of queueing.
+        adapter = HTTPAdapter(
+            max_retries=retry_strategy,
+            pool_connections=20,  # Number of per-host pools to cache
+            pool_maxsize=50,  # Connections kept alive per host
+            pool_block=False,
+        )
         session.mount("http://", adapter)
         session.mount("https://", adapter)
 
         return session
 
+    def close(self) -> None:
+        """
+        Close the session's pooled connections.
+
+        The client stays usable afterwards; the next request simply opens a
+        new connection. A previous stop() is cleared as well.
+        """
+        self.session.close()
+        self._stop_event.clear()
+
+    def stop(self) -> None:
+        """
+        Cancel requests that are waiting in other threads.
+
+        Rate limit waits end immediately and every request made until the
+        next close() fails with error code "cancelled", so worker threads
+        finish quickly when a run is interrupted.
+        """
+        self._stop_event.set()
+
+    def _raise_if_stopped(self) -> None:
+        """
+        Raise if stop() has been called.
+
+        Raises:
+            FirefliesAPIError: With error code "cancelled"
+        """
+        if self._stop_event.is_set():
+            raise FirefliesAPIError("Request cancelled", error_code="cancelled")
+
     def validate_api_key(self) -> bool:
         """
-        Validate API key by making a test request.
+        Validate API key by making a minimal test request.
 
         Returns:
             True if API key is valid, False otherwise
-        """
-        # Make a simple test request to validate the API key
-        test_query = """
-        query {
-            user {
-                user_id
-                email
-            }
-        }
-        """
 
+        Raises:
+            FirefliesAPIError: For API errors other than authentication failures
+        """
         try:
-            self._make_graphql_request(test_query, {})
+            self._make_graphql_request(_AUTH_CHECK_QUERY, {})
             self.logger.info("API key validation successful")
             return True
-        except FirefliesAPIError as e:
-            if "authentication" in str(e).lower() or "unauthorized" in str(e).lower():
-                self.logger.error(
-                    "Invalid API key. Please check your FIREFLIES_API_KEY in .env file"
-                )
-                return False
-            else:
-                # Re-raise other API errors
-                raise
+        except FirefliesAuthError:
+            self.logger.error(
+                "Invalid API key. Please check your FIREFLIES_API_KEY in .env file"
+            )
+            return False
+        except FirefliesAPIError:
+            # Re-raise other API errors
+            raise
         except Exception as e:
             self.logger.error(f"Failed to validate API key: {str(e)}")
             return False
 
+    def _post(self, payload: Dict[str, Any]) -> requests.Response:
+        """
+        Send a GraphQL payload to the API, paced by the client's rate limiter.
+
+        Every request to the API goes through here, so API_REQUESTS_PER_MINUTE
+        covers all of them.
+
+        Args:
+            payload: GraphQL query and variables
+
+        Returns:
+            The HTTP response
+
+        Raises:
+            FirefliesAPIError: If the client was stopped
+        """
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire(self._stop_event)
+        self._raise_if_stopped()
+
+        # Content-Type: application/json is set on the session
+        return self.session.post(
+            self.base_url,
+            data=_json_dumps(payload),
+            timeout=30,  # 30 second timeout
+        )
+
     def _make_graphql_request(
         self, query: str, variables: Dict[str, Any]
     ) -> Dict[str, Any]:
@@ -169,29 +549,28 @@ class FirefliesClient:
 
         while True:
             try:
-                self.logger.debug(f"Making GraphQL request: {query[:100]}...")
-                self.logger.debug(f"Variables: {variables}")
+                # %-style arguments so nothing is formatted unless DEBUG is on
+                self.logger.debug("Making GraphQL request: %s...", query[:100])
+                self.logger.debug("Variables: %s", variables)
 
-                response = self.session.post(
-                    self.base_url, json=payload, timeout=30  # 30 second timeout
-                )
+                response = self._post(payload)
 
                 # Log response status
-                self.logger.debug(f"Response status: {response.status_code}")
+                self.logger.debug("Response status: %s", response.status_code)
 
                 # Handle HTTP errors
                 if response.status_code == 401:
-                    raise FirefliesAPIError(
+                    raise FirefliesAuthError(
                         "Authentication failed. Please check your API key."
                     )
                 elif response.status_code == 429:
-                    # HTTP-level rate limit (less common than GraphQL error body)
-                    self.logger.warning(
-                        "HTTP 429 rate limit encountered. "
-                        "Waiting 60 seconds before retrying..."
+                    # HTTP-level rate limit. The session's urllib3 Retry has
+                    # already backed off (honouring Retry-After) and given up.
+                    raise FirefliesAPIError(
+                        "Rate limit exceeded (HTTP 429) and retries exhausted. "
+                        "Please try again later.",
+                        error_code="too_many_requests",
                     )
-                    time.sleep(60)
-                    continue
                 elif response.status_code >= 400:
                     raise FirefliesAPIError(
                         f"HTTP error {response.status_code}: {response.text}"
@@ -199,35 +578,39 @@ class FirefliesClient:
 
                 # Parse JSON response
                 try:
-                    data = response.json()
+                    data = _json_loads(response.content)
                 except json.JSONDecodeError as e:
                     raise FirefliesAPIError(f"Invalid JSON response: {str(e)}")
 
                 # Check for GraphQL errors
-                if "errors" in data and data["errors"]:
-                    error_messages = [
-                        error.get("message", "Unknown error")
-                        for error in data["errors"]
-                    ]
-                    error_codes = [
-                        error.get("extensions", {}).get("code")
-                        for error in data["errors"]
-                    ]
-
-                    # Detect Fireflies rate limiting in the GraphQL error body.
-                    # Example message:
-                    # "Too many requests. Please retry after 5:22:26 PM (UTC)"
-                    rate_limit_messages = [
-                        msg
-                        for msg in error_messages
-                        if "too many requests" in msg.lower()
-                        and "retry after" in msg.lower()
-                    ]
-
-                    if rate_limit_messages:
-                        wait_seconds = self._parse_rate_limit_retry_after(
-                            rate_limit_messages[0]
-                        )
+                errors = data.get("errors")
+                if errors:
+                    # Collect messages in a single pass, noting the first one
+                    # that signals Fireflies rate limiting (code
+                    # "too_many_requests", or a message like "Too many
+                    # requests. Please retry after 5:22:26 PM (UTC)").
+                    # A rejected API key is reported with code "auth_failed".
+                    # These arrive in a 200 response, so urllib3's Retry never
+                    # sees them and the wait has to happen here.
+                    error_messages = []
+                    rate_limit_error = None
+                    auth_failed = False
+                    for error in errors:
+                        message = error.get("message", "Unknown error")
+                        error_messages.append(message)
+                        code = error.get("extensions", {}).get("code")
+                        if code == "auth_failed":
+                            auth_failed = True
+                        if rate_limit_error is None:
+                            lowered = message.lower()
+                            if code == "too_many_requests" or (
+                                "too many requests" in lowered
+                                and "retry after" in lowered
+                            ):
+                                rate_limit_error = error
+
+                    if rate_limit_error is not None:
+                        wait_seconds = self._rate_limit_wait_seconds(rate_limit_error)
 
                         # Fall back to a conservative default if parsing fails
                         if wait_seconds is None:
@@ -237,14 +620,23 @@ class FirefliesClient:
                             "⏳ Fireflies rate limit reached. "
                             f"Waiting {wait_seconds:.0f} seconds before retrying GraphQL request..."
                         )
-                        time.sleep(wait_seconds)
+                        # Wait on the stop event, so stop() can end it early
+                        self._stop_event.wait(wait_seconds)
+                        self._raise_if_stopped()
                         # After waiting, retry the entire GraphQL request
                         continue
 
+                    if auth_failed:
+                        raise FirefliesAuthError(
+                            f"Authentication failed: {'; '.join(error_messages)}",
+                            error_code="auth_failed",
+                            response_data=data,
+                        )
+
                     # For non-rate-limit GraphQL errors, surface a clean exception
                     raise FirefliesAPIError(
                         f"GraphQL errors: {'; '.join(error_messages)}",
-                        error_code=error_codes[0] if error_codes else None,
+                        error_code=errors[0].get("extensions", {}).get("code"),
                         response_data=data,
                     )
 
@@ -265,6 +657,27 @@ class FirefliesClient:
             except requests.exceptions.RequestException as e:
                 raise FirefliesAPIError(f"Request failed: {str(e)}")
 
+    def _rate_limit_wait_seconds(self, error: Dict[str, Any]) -> Optional[float]:
+        """
+        Work out how long to wait after a Fireflies rate limit error.
+
+        The documented extensions.metadata.retryAfter field (epoch
+        milliseconds) is used when present; otherwise the time in the error
+        message is parsed.
+
+        Args:
+            error: A single GraphQL error object
+
+        Returns:
+            Number of seconds to wait from now, or None if unknown
+        """
+        metadata = error.get("extensions", {}).get("metadata") or {}
+        retry_after = metadata.get("retryAfter")
+        if isinstance(retry_after, (int, float)):
+            return max(0.0, retry_after / 1000 - time.time())
+
+        return self._parse_rate_limit_retry_after(error.get("message", ""))
+
     def _parse_rate_limit_retry_after(self, message: str) -> Optional[int]:
         """
         Extract "retry after" time from a Fireflies rate limit message.
@@ -344,35 +757,39 @@ class FirefliesClient:
         if skip < 0:
             raise ValueError("Skip cannot be negative")
 
-        # Construct GraphQL query for transcripts list
-        query = """
-        query Transcripts($fromDate: DateTime, $toDate: DateTime, $limit: Int, $skip: Int) {
-            transcripts(
-                fromDate: $fromDate, toDate: $toDate, limit: $limit, skip: $skip
-            ) {
-                id
-                title
-                organizer_email
-                participants
-                fireflies_users
-                duration
-                dateString
-                date
-                transcript_url
+        return self._fetch_transcripts_unchecked(
+            {
+                "fromDate": from_date,
+                "toDate": to_date,
+                "limit": limit,
+                "skip": skip,
             }
-        }
+        )
+
+    def _fetch_transcripts_unchecked(
+        self, variables: Dict[str, Any]
+    ) -> List[Dict[str, Any]]:
         """
+        Fetch one page of transcripts without re-validating the arguments.
 
-        variables = {
-            "fromDate": from_date,
-            "toDate": to_date,
-            "limit": limit,
-            "skip": skip,
-        }
+        Used by fetch_transcripts after it has validated its inputs, and by
+        the pagination loop, which validates once up front.
+
+        Args:
+            variables: Query variables (fromDate, toDate, limit, skip)
 
+        Returns:
+            List of transcript metadata dictionaries
+
+        Raises:
+            FirefliesAPIError: If the request fails
+        """
         try:
-            self.logger.info(f"Fetching transcripts from {from_date} to {to_date}")
-            data = self._make_graphql_request(query, variables)
+            self.logger.info(
+                f"Fetching transcripts from {variables['fromDate']} "
+                f"to {variables['toDate']}"
+            )
+            data = self._make_graphql_request(_TRANSCRIPTS_QUERY, variables)
 
             transcripts = data.get("transcripts", [])
             self.logger.info(f"Retrieved {len(transcripts)} transcripts")
@@ -384,15 +801,19 @@ class FirefliesClient:
         except Exception as e:
             raise FirefliesAPIError(f"Failed to fetch transcripts: {str(e)}")
 
-    def fetch_transcript_details(self, transcript_id: str) -> Dict[str, Any]:
+    def fetch_transcript_details(
+        self, transcript_id: str, include: Optional[Iterable[str]] = None
+    ) -> Dict[str, Any]:
         """
         Fetch detailed transcript content including sentences and speakers.
 
         Args:
             transcript_id: Unique identifier of the transcript
+            include: Optional sections to request ("speakers", "sentences",
+                "summary"). Defaults to all of them; metadata is always included.
 
         Returns:
-            Detailed transcript data including sentences and speakers
+            Detailed transcript data including the requested sections
 
         Raises:
             FirefliesAPIError: If the request fails
@@ -400,43 +821,14 @@ class FirefliesClient:
         if not transcript_id or not transcript_id.strip():
             raise ValueError("Transcript ID cannot be empty")
 
-        # Construct GraphQL query for detailed transcript
-        query = """
-        query Transcript($transcriptId: String!) {
-            transcript(id: $transcriptId) {
-                id
-                title
-                organizer_email
-                participants
-                fireflies_users
-                duration
-                dateString
-                date
-                transcript_url
-                speakers {
-                    id
-                    name
-                }
-                sentences {
-                    text
-                    speaker_name
-                    start_time
-                    end_time
-                }
-                summary {
-                    action_items
-                    keywords
-                    outline
-                }
-            }
-        }
-        """
-
+        sections = _resolve_detail_sections(include)
         variables = {"transcriptId": transcript_id}
 
         try:
             self.logger.info(f"Fetching detailed transcript: {transcript_id}")
-            data = self._make_graphql_request(query, variables)
+            data = self._make_graphql_request(
+                _get_transcript_detail_query(sections), variables
+            )
 
             transcript = data.get("transcript")
             if not transcript:
@@ -452,16 +844,83 @@ class FirefliesClient:
         except Exception as e:
             raise FirefliesAPIError(f"Failed to fetch transcript details: {str(e)}")
 
+    def fetch_transcript_details_batch(
+        self, transcript_ids: List[str], include: Optional[Iterable[str]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Fetch several detailed transcripts with a single GraphQL request.
+
+        Each transcript is selected under its own alias in one query
+        document, so a batch costs one round-trip (and one request against
+        the API rate limit) instead of one per transcript. If any transcript
+        in the batch fails, the whole request fails; callers can retry the
+        IDs individually with fetch_transcript_details.
+
+        Args:
+            transcript_ids: Transcript IDs to fetch
+            include: Optional sections to request, as for
+                fetch_transcript_details
+
+        Returns:
+            Detailed transcripts, in the same order as transcript_ids
+
+        Raises:
+            FirefliesAPIError: If the request fails or a transcript is missing
+        """
+        if any(not tid or not tid.strip() for tid in transcript_ids):
+            raise ValueError("Transcript ID cannot be empty")
+
+        sections = _resolve_detail_sections(include)
+
+        if not transcript_ids:
+            return []
+        if len(transcript_ids) == 1:
+            return [self.fetch_transcript_details(transcript_ids[0], include=sections)]
+
+        variables = {f"id{i}": tid for i, tid in enumerate(transcript_ids)}
+
+        try:
+            self.logger.info(
+                f"Fetching {len(transcript_ids)} detailed transcripts in one request"
+            )
+            data = self._make_graphql_request(
+                _get_transcript_batch_query(sections, len(transcript_ids)), variables
+            )
+
+            transcripts = []
+            for i, transcript_id in enumerate(transcript_ids):
+                transcript = data.get(f"t{i}")
+                if not transcript:
+                    raise FirefliesAPIError(f"Transcript not found: {transcript_id}")
+                transcripts.append(transcript)
+
+            return transcripts
+
+        except FirefliesAPIError:
+            raise
+        except Exception as e:
+            raise FirefliesAPIError(f"Failed to fetch transcript details: {str(e)}")
+
     def fetch_all_transcripts_in_range(
-        self, from_date: str, to_date: str, max_per_query: int = 50
+        self,
+        from_date: str,
+        to_date: str,
+        max_per_query: int = 50,
+        shards: int = 1,
     ) -> List[Dict[str, Any]]:
         """
         Fetch all transcripts in a date range, handling pagination automatically.
 
+        With shards > 1 the range is split into that many consecutive
+        sub-ranges which are paginated concurrently, so a long window costs
+        roughly one shard's worth of round-trips instead of all of them.
+        Results are merged and de-duplicated by transcript ID.
+
         Args:
             from_date: Start date in ISO 8601 format
             to_date: End date in ISO 8601 format
             max_per_query: Maximum transcripts per query (default 50)
+            shards: Number of sub-ranges to fetch in parallel (default 1)
 
         Returns:
             Complete list of all transcripts in the date range
@@ -469,16 +928,77 @@ class FirefliesClient:
         Raises:
             FirefliesAPIError: If any request fails
         """
-        all_transcripts = []
-        skip = 0
+        # Validate once here; the pagination loop trusts these values
+        if max_per_query < 1 or max_per_query > 50:
+            raise ValueError("max_per_query must be between 1 and 50 (API maximum)")
+
+        if shards < 1:
+            raise ValueError("shards must be at least 1")
 
         self.logger.info(f"Fetching all transcripts from {from_date} to {to_date}")
 
+        if shards == 1:
+            all_transcripts = self._fetch_range_pages(from_date, to_date, max_per_query)
+        else:
+            ranges = _split_date_range(from_date, to_date, shards)
+            executor = ThreadPoolExecutor(max_workers=len(ranges))
+            try:
+                results = executor.map(
+                    lambda date_range: self._fetch_range_pages(
+                        date_range[0], date_range[1], max_per_query
+                    ),
+                    ranges,
+                )
+
+                # Neighbouring shards overlap slightly, so drop duplicates
+                merged: Dict[Any, Dict[str, Any]] = {}
+                for batch in results:
+                    for transcript in batch:
+                        merged.setdefault(transcript.get("id"), transcript)
+            except KeyboardInterrupt:
+                # Wake shards waiting out a rate limit, so the shutdown below
+                # doesn't block until their wait ends
+                self.stop()
+                raise
+            finally:
+                executor.shutdown(wait=True, cancel_futures=True)
+            all_transcripts = list(merged.values())
+
+        self.logger.info(
+            f"Finished fetching transcripts. Total: {len(all_transcripts)}"
+        )
+        return all_transcripts
+
+    def _fetch_range_pages(
+        self, from_date: str, to_date: str, max_per_query: int
+    ) -> List[Dict[str, Any]]:
+        """
+        Page through every transcript in a single date range.
+
+        Args:
+            from_date: Start date in ISO 8601 format
+            to_date: End date in ISO 8601 format
+            max_per_query: Maximum transcripts per query
+
+        Returns:
+            All transcripts in the date range
+
+        Raises:
+            FirefliesAPIError: If any request fails
+        """
+        all_transcripts = []
+
+        # Only "skip" changes between pages, so build the variables once
+        variables = {
+            "fromDate": from_date,
+            "toDate": to_date,
+            "limit": max_per_query,
+            "skip": 0,
+        }
+
         while True:
             # Fetch batch of transcripts
-            transcripts = self.fetch_transcripts(
-                from_date=from_date, to_date=to_date, limit=max_per_query, skip=skip
-            )
+            transcripts = self._fetch_transcripts_unchecked(variables)
 
             # If no transcripts returned, we've reached the end
             if not transcripts:
@@ -494,14 +1014,8 @@ class FirefliesClient:
                 break
 
             # Prepare for next batch
-            skip += max_per_query
+            variables["skip"] += max_per_query
 
-            # Small delay to be respectful to the API
-            time.sleep(0.1)
-
-        self.logger.info(
-            f"Finished fetching transcripts. Total: {len(all_transcripts)}"
-        )
         return all_transcripts
 
     def test_connection(self) -> bool:
@@ -513,16 +1027,42 @@ class FirefliesClient:
         """
         try:
             # Simple query to test connection
-            query = """
-            query {
-                user {
-                    user_id
-                }
-            }
-            """
-            self._make_graphql_request(query, {})
+            self._make_graphql_request(_USER_QUERY, {})
             self.logger.info("Connection test successful")
             return True
         except Exception as e:
             self.logger.error(f"Connection test failed: {str(e)}")
             return False
+
+
+@lru_cache(maxsize=4)
+def get_client(
+    api_key: str,
+    base_url: str = "https://api.fireflies.ai/graphql",
+    logger: Optional[logging.Logger] = None,
+    key_validated: bool = False,
+    requests_per_minute: Optional[float] = None,
+) -> FirefliesClient:
+    """
+    Return a shared FirefliesClient for the given settings.
+
+    Repeated calls with the same arguments return the same client, so callers
+    share its session and the kept-alive TCP/TLS connections in its pool.
+
+    Args:
+        api_key: Fireflies API key for authentication
+        base_url: Base URL for the Fireflies GraphQL API
+        logger: Logger instance for logging operations
+        key_validated: See FirefliesClient
+        requests_per_minute: See FirefliesClient
+
+    Returns:
+        Cached FirefliesClient instance
+    """
+    return FirefliesClient(
+        api_key=api_key,
+        base_url=base_url,
+        logger=logger,
+        key_validated=key_validated,
+        requests_per_minute=requests_per_minute,
+    )
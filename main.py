@@ -17,18 +17,29 @@ The script will:
 6. Provide a summary of the operation
 """
 
+import signal
 import sys
 import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Tuple
 
 # Add project root to Python path
 project_root = Path(__file__).parent
 sys.path.insert(0, str(project_root))
 
-from config import Config, ensure_output_directory, setup_logging
-from fireflies_client import FirefliesAPIError, FirefliesClient
-from transcript_formatter import TranscriptFormatter
+# The project modules (and requests, urllib3 and dotenv behind them) are
+# imported where they are first needed, so `python main.py --help` doesn't
+# pay for loading them.
+
+# Maximum number of transcripts requested in one batched GraphQL query
+DETAIL_BATCH_SIZE = 10
+
+# Number of transcripts between progress log lines
+PROGRESS_LOG_INTERVAL = 10
+
+# Number of background threads formatting and writing transcripts
+SAVE_WORKERS = 4
 
 
 class FirefliesFetcher:
@@ -39,12 +50,21 @@ class FirefliesFetcher:
     API communication, data processing, and file output.
     """
 
-    def __init__(self):
-        """Initialize the fetcher with configuration and logging."""
+    def __init__(self, full_stats: bool = False):
+        """
+        Initialize the fetcher with configuration and logging.
+
+        Args:
+            full_stats: Scan the whole output directory for the summary
+                report instead of only counting files written in this run
+        """
+        from config import setup_logging
+
         self.logger = setup_logging("INFO")
         self.config = None
         self.client = None
         self.formatter = None
+        self.full_stats = full_stats
         self.stats = {
             "total_transcripts": 0,
             "successful_downloads": 0,
@@ -61,6 +81,10 @@ class FirefliesFetcher:
         Returns:
             True if initialization successful, False otherwise
         """
+        from config import Config, ensure_output_directory
+        from fireflies_client import get_client
+        from transcript_formatter import TranscriptFormatter
+
         try:
             self.logger.info("🚀 Initializing Fireflies Meeting Fetcher...")
 
@@ -73,19 +97,17 @@ class FirefliesFetcher:
 
             # Initialize API client
             self.logger.info("🔑 Initializing API client...")
-            self.client = FirefliesClient(
+            self.client = get_client(
                 api_key=self.config.api_key,
                 base_url=self.config.api_base_url,
                 logger=self.logger,
+                key_validated=True,
+                requests_per_minute=self.config.api_requests_per_minute,
             )
 
-            # Test API connection
-            self.logger.info("🔌 Testing API connection...")
-            if not self.client.validate_api_key():
-                self.logger.error(
-                    "❌ API key validation failed. Please check your FIREFLIES_API_KEY."
-                )
-                return False
+            # The API key is not checked with a separate request here: the
+            # first transcript list request fails with FirefliesAuthError if
+            # it is rejected, which run() reports.
 
             # Initialize formatter
             self.logger.info("📝 Initializing transcript formatter...")
@@ -97,7 +119,7 @@ class FirefliesFetcher:
             return True
 
         except Exception as e:
-            self.logger.error(f"❌ Initialization failed: {str(e)}")
+            self.logger.error("❌ Initialization failed: %s", e)
             return False
 
     def fetch_transcript_list(self) -> List[Dict[str, Any]]:
@@ -107,105 +129,224 @@ class FirefliesFetcher:
         Returns:
             List of transcript metadata dictionaries
         """
+        from fireflies_client import FirefliesAPIError, FirefliesAuthError
+
         try:
             self.logger.info("📅 Calculating date range...")
             from_date, to_date = self.config.get_date_range_iso()
 
-            self.logger.info(f"📊 Fetching transcripts from {from_date} to {to_date}")
+            self.logger.info(
+                "📊 Fetching transcripts from %s to %s", from_date, to_date
+            )
 
-            # Fetch all transcripts in the date range
+            # Fetch all transcripts in the date range, one shard per month of
+            # the window (bounded by the concurrency setting) in parallel
             transcripts = self.client.fetch_all_transcripts_in_range(
                 from_date=from_date,
                 to_date=to_date,
                 max_per_query=self.config.max_transcripts_per_query,
+                shards=self._list_shard_count(),
             )
 
             self.stats["total_transcripts"] = len(transcripts)
-            self.logger.info(f"📋 Found {len(transcripts)} transcripts to process")
+            self.logger.info("📋 Found %d transcripts to process", len(transcripts))
 
             return transcripts
 
+        except FirefliesAuthError:
+            # Reported by run()
+            raise
         except FirefliesAPIError as e:
-            self.logger.error(f"❌ API error while fetching transcript list: {str(e)}")
+            self.logger.error("❌ API error while fetching transcript list: %s", e)
             raise
         except Exception as e:
             self.logger.error(
-                f"❌ Unexpected error while fetching transcript list: {str(e)}"
+                "❌ Unexpected error while fetching transcript list: %s", e
             )
             raise
 
-    def process_transcript(self, transcript_metadata: Dict[str, Any]) -> bool:
+    def _list_shard_count(self) -> int:
         """
-        Process a single transcript: fetch details and save as markdown.
-
-        Args:
-            transcript_metadata: Basic transcript metadata from the list
+        Choose how many date sub-ranges to fetch the transcript list with.
 
         Returns:
-            True if processing successful, False otherwise
+            Roughly one shard per 30 days of the date range, capped at 8 and
+            at MAX_CONCURRENT_REQUESTS
         """
-        transcript_id = transcript_metadata.get("id")
-        title = transcript_metadata.get("title", "Unknown Meeting")
+        start, end = self.config.get_date_range()
+        months = -(-(end - start).days // 30)  # Ceiling division
+        return max(1, min(8, months, self.config.max_concurrent_requests))
 
-        try:
-            self.logger.info(f"📥 Processing: {title}")
+    def _record_saved(self, file_path: Path) -> None:
+        """
+        Log a transcript that was saved successfully.
 
-            # If we've already saved this transcript ID in a previous run,
-            # skip the expensive detailed API call and file write.
-            if self.formatter.is_transcript_already_saved(transcript_id):
-                self.logger.info(
-                    f"⏭️  Skipping already-downloaded transcript: {title} "
-                    f"(ID: {transcript_id})"
-                )
-                self.stats["skipped_files"] += 1
-                return True
+        Args:
+            file_path: Path of the written markdown file
+        """
+        self.stats["successful_downloads"] += 1
+        self.logger.info("✅ Saved: %s", file_path.name)
 
-            # Fetch detailed transcript content
-            detailed_transcript = self.client.fetch_transcript_details(transcript_id)
+    def _record_failure(
+        self, transcript_metadata: Dict[str, Any], error: BaseException
+    ) -> None:
+        """
+        Log a transcript that could not be downloaded or saved.
 
-            # Save as markdown file
-            file_path = self.formatter.save_transcript(detailed_transcript)
+        Args:
+            transcript_metadata: Basic transcript metadata from the list
+            error: The exception that stopped processing
+        """
+        from fireflies_client import FirefliesAPIError
 
-            self.stats["successful_downloads"] += 1
-            self.logger.info(f"✅ Saved: {file_path.name}")
+        title = transcript_metadata.get("title", "Unknown Meeting")
 
-            return True
+        if isinstance(error, FirefliesAPIError):
+            self.logger.error("❌ API error processing '%s': %s", title, error)
+        else:
+            self.logger.error("❌ Error processing '%s': %s", title, error)
 
-        except FirefliesAPIError as e:
-            self.logger.error(f"❌ API error processing '{title}': {str(e)}")
-            self.stats["failed_downloads"] += 1
-            return False
-        except Exception as e:
-            self.logger.error(f"❌ Error processing '{title}': {str(e)}")
-            self.stats["failed_downloads"] += 1
-            return False
+        self.stats["failed_downloads"] += 1
 
     def process_all_transcripts(self, transcripts: List[Dict[str, Any]]) -> None:
         """
         Process all transcripts with progress tracking.
 
+        Transcript details are downloaded in batches of up to
+        DETAIL_BATCH_SIZE per GraphQL request, on a pool of up to
+        MAX_CONCURRENT_REQUESTS worker threads so request latency overlaps.
+        Downloaded transcripts are formatted and written by up to
+        SAVE_WORKERS background writer threads, so disk I/O never holds up
+        handing out the next request. Statistics are updated on this thread,
+        and the saved-transcript index is flushed as each batch completes.
+        A batch that fails is retried one transcript at a time, so a single
+        bad transcript doesn't fail its neighbours.
+
         Args:
             transcripts: List of transcript metadata to process
         """
+        from fireflies_client import FirefliesAPIError, FirefliesAuthError
+
         if not transcripts:
             self.logger.info("📭 No transcripts to process")
             return
 
-        self.logger.info(f"🔄 Starting to process {len(transcripts)} transcripts...")
-
-        for i, transcript in enumerate(transcripts, 1):
-            # Progress indicator
-            progress = f"[{i}/{len(transcripts)}]"
-            self.logger.info(
-                f"📊 {progress} Processing transcript {i} of {len(transcripts)}"
-            )
-
-            # Process the transcript
-            self.process_transcript(transcript)
-
-            # Small delay to be respectful to the API
-            if i < len(transcripts):  # Don't delay after the last one
-                time.sleep(0.5)
+        self.logger.info("🔄 Starting to process %d transcripts...", len(transcripts))
+
+        # Only transcripts missing from the saved-transcript index need a
+        # detail request; everything else is skipped in one pass.
+        pending = self.formatter.filter_unsaved_transcripts(transcripts)
+        skipped = len(transcripts) - len(pending)
+        if skipped:
+            self.stats["skipped_files"] += skipped
+            self.logger.info("⏭️  Skipping %d already-downloaded transcripts", skipped)
+
+        # A transcript without an ID can't be requested, and would fail every
+        # other transcript in its batch, so it is recorded as failed up front
+        if not all(transcript.get("id") for transcript in pending):
+            with_ids = []
+            for transcript in pending:
+                if transcript.get("id"):
+                    with_ids.append(transcript)
+                else:
+                    self._record_failure(
+                        transcript, ValueError("Transcript ID cannot be empty")
+                    )
+            pending = with_ids
+
+        total = len(pending)
+        if pending:
+            workers = min(self.config.max_concurrent_requests, total)
+
+            # Spread the transcripts over all workers before filling batches
+            batch_size = max(1, min(DETAIL_BATCH_SIZE, -(-total // workers)))
+
+            executor = ThreadPoolExecutor(max_workers=workers)
+            writer = ThreadPoolExecutor(max_workers=SAVE_WORKERS)
+            saves: List[Tuple[Future, Dict[str, Any]]] = []
+            try:
+                futures: Dict[Future, List[Dict[str, Any]]] = {}
+
+                def submit(batch: List[Dict[str, Any]]) -> None:
+                    ids = [transcript.get("id") for transcript in batch]
+                    future = executor.submit(
+                        self.client.fetch_transcript_details_batch, ids
+                    )
+                    futures[future] = batch
+
+                for start in range(0, total, batch_size):
+                    submit(pending[start : start + batch_size])
+
+                processed = 0
+                while futures:
+                    done, _ = wait(futures, return_when=FIRST_COMPLETED)
+
+                    # Persist the index for everything saved so far, so a
+                    # killed run doesn't download those transcripts again
+                    self.formatter.flush_index()
+
+                    for future in done:
+                        batch = futures.pop(future)
+                        error = future.exception()
+
+                        if (
+                            len(batch) > 1
+                            and isinstance(error, FirefliesAPIError)
+                            and not isinstance(error, FirefliesAuthError)
+                            and error.error_code != "too_many_requests"
+                        ):
+                            self.logger.warning(
+                                "⚠️  Batch of %d transcripts failed (%s); "
+                                "retrying them individually",
+                                len(batch),
+                                error,
+                            )
+                            for transcript in batch:
+                                submit([transcript])
+                            continue
+
+                        for index, transcript in enumerate(batch):
+                            processed += 1
+
+                            # Progress indicator, every PROGRESS_LOG_INTERVAL
+                            # transcripts and for the last one. This counts
+                            # finished download attempts, successful or not;
+                            # saving happens afterwards on the writer threads.
+                            if (
+                                processed % PROGRESS_LOG_INTERVAL == 0
+                                or processed == total
+                            ):
+                                self.logger.info(
+                                    "📊 [%d/%d] transcripts processed",
+                                    processed,
+                                    total,
+                                )
+
+                            # Queue the transcript for saving
+                            if error is not None:
+                                self._record_failure(transcript, error)
+                            else:
+                                save = writer.submit(
+                                    self.formatter.save_transcript,
+                                    future.result()[index],
+                                )
+                                saves.append((save, transcript))
+            except KeyboardInterrupt:
+                # Wake workers waiting out a rate limit, so the shutdown
+                # below doesn't block until their wait ends
+                self.client.stop()
+                raise
+            finally:
+                # On interruption, don't start any downloads still queued,
+                # but let transcripts already downloaded finish saving
+                executor.shutdown(wait=True, cancel_futures=True)
+                writer.shutdown(wait=True)
+
+            for save, transcript in saves:
+                try:
+                    self._record_saved(save.result())
+                except Exception as e:
+                    self._record_failure(transcript, e)
 
         self.logger.info("🏁 Finished processing all transcripts")
 
@@ -221,32 +362,41 @@ class FirefliesFetcher:
         self.logger.info("📊 FIReflies Meeting Fetcher - Summary Report")
         self.logger.info("📊 " + "=" * 60)
         self.logger.info(
-            f"📊 Total transcripts found: {self.stats['total_transcripts']}"
+            "📊 Total transcripts found: %d", self.stats["total_transcripts"]
         )
         self.logger.info(
-            f"📊 Successfully downloaded: {self.stats['successful_downloads']}"
+            "📊 Successfully downloaded: %d", self.stats["successful_downloads"]
         )
-        self.logger.info(f"📊 Failed downloads: {self.stats['failed_downloads']}")
+        self.logger.info("📊 Failed downloads: %d", self.stats["failed_downloads"])
         success_rate = (
             self.stats["successful_downloads"] / max(1, self.stats["total_transcripts"])
         ) * 100
-        self.logger.info(f"📊 Success rate: {success_rate:.1f}%")
+        self.logger.info("📊 Success rate: %.1f%%", success_rate)
 
         if duration:
-            self.logger.info(f"📊 Total time: {duration:.1f} seconds")
+            self.logger.info("📊 Total time: %.1f seconds", duration)
 
-        # File statistics
-        file_stats = self.formatter.get_file_stats()
-        self.logger.info(f"📊 Files in output directory: {file_stats['total_files']}")
-        self.logger.info(f"📊 Total size: {file_stats['total_size_mb']} MB")
+        # File statistics. Scanning the output directory also counts files
+        # from earlier runs, so it is only done when asked for.
+        if self.full_stats:
+            file_stats = self.formatter.get_file_stats()
+            self.logger.info(
+                "📊 Files in output directory: %d", file_stats["total_files"]
+            )
+            self.logger.info("📊 Total size: %s MB", file_stats["total_size_mb"])
+        else:
+            self.logger.info(
+                "📊 Written this run: %.2f MB",
+                self.formatter.bytes_written / (1024 * 1024),
+            )
 
         self.logger.info("📊 " + "=" * 60)
 
         if self.stats["failed_downloads"] > 0:
-            failed_count = self.stats["failed_downloads"]
             self.logger.warning(
-                f"⚠️  {failed_count} transcripts failed to download. "
-                "Check the logs above for details."
+                "⚠️  %d transcripts failed to download. "
+                "Check the logs above for details.",
+                self.stats["failed_downloads"],
             )
 
     def run(self) -> bool:
@@ -256,6 +406,8 @@ class FirefliesFetcher:
         Returns:
             True if the process completed successfully, False otherwise
         """
+        from fireflies_client import FirefliesAuthError
+
         try:
             # Record start time
             self.stats["start_time"] = time.time()
@@ -282,9 +434,22 @@ class FirefliesFetcher:
         except KeyboardInterrupt:
             self.logger.info("⏹️  Operation cancelled by user")
             return False
+        except FirefliesAuthError:
+            self.logger.error(
+                "❌ API key validation failed. Please check your FIREFLIES_API_KEY."
+            )
+            return False
         except Exception as e:
-            self.logger.error(f"❌ Fatal error: {str(e)}")
+            self.logger.error("❌ Fatal error: %s", e)
             return False
+        finally:
+            # Release the kept-alive connections held by the client's session
+            if self.client is not None:
+                self.client.close()
+
+            # Persist the saved-transcript index
+            if self.formatter is not None:
+                self.formatter.close()
 
 
 def print_usage():
@@ -305,14 +470,28 @@ Configuration:
 - OUTPUT_DIRECTORY: Where to save files (default: 'transcripts')
 - MONTHS_TO_FETCH: How many months back to fetch (default: 2)
 - MAX_TRANSCRIPTS_PER_QUERY: API query limit (default: 50)
+- MAX_CONCURRENT_REQUESTS: Parallel transcript downloads (default: 4)
+- API_REQUESTS_PER_MINUTE: Client-side request rate limit (default: 60, 0 = off)
+
+Options:
+- --full-stats: Report totals for the whole output directory in the summary
 
 For more information, see index.md
 """
     )
 
 
+def _handle_sigterm(signum, frame):
+    """Treat SIGTERM like Ctrl+C, so pending saves and the index are flushed."""
+    raise KeyboardInterrupt
+
+
 def main():
     """Main entry point for the script."""
+    # Service managers and cron stop the script with SIGTERM, which would
+    # otherwise end the process without running any cleanup
+    signal.signal(signal.SIGTERM, _handle_sigterm)
+
     try:
         # Check if help is requested
         if len(sys.argv) > 1 and sys.argv[1] in ["-h", "--help", "help"]:
@@ -320,7 +499,7 @@ def main():
             return 0
 
         # Create and run the fetcher
-        fetcher = FirefliesFetcher()
+        fetcher = FirefliesFetcher(full_stats="--full-stats" in sys.argv[1:])
         success = fetcher.run()
 
         return 0 if success else 1
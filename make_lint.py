@@ -5,10 +5,16 @@ This module provides utilities to format and lint all Python code in the project
 according to Python best practices and PEP 8 standards.
 """
 
+import os
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Optional
+from typing import Callable, List, Optional
+
+# Directories never searched for Python files (in addition to hidden
+# directories and anything that looks like a virtual environment)
+_SKIPPED_DIRS = frozenset({"__pycache__", "node_modules"})
 
 
 class LintFormatter:
@@ -28,20 +34,30 @@ class LintFormatter:
         """
         self.project_root = Path(project_root) if project_root else Path.cwd()
         self.python_files = self._find_python_files()
+        # String form of the paths, as passed on every tool's command line
+        self.python_file_strs = [str(f) for f in self.python_files]
 
     def _find_python_files(self) -> List[Path]:
         """
         Find all Python files in the project.
 
+        Called once from __init__; the result is cached in self.python_files
+        and shared by every tool run.
+
         Returns:
             List of Python file paths
         """
         python_files = []
-        for file_path in self.project_root.rglob("*.py"):
-            # Skip __pycache__ directories and virtual environments
-            if "__pycache__" not in str(file_path) and "venv" not in str(file_path):
-                python_files.append(file_path)
-        return python_files
+        for root, dirs, files in os.walk(self.project_root):
+            # Prune skipped directories in place so os.walk never descends
+            # into them (virtual environments can hold thousands of files)
+            dirs[:] = [
+                d
+                for d in dirs
+                if d not in _SKIPPED_DIRS and not d.startswith(".") and "venv" not in d
+            ]
+            python_files.extend(Path(root) / f for f in files if f.endswith(".py"))
+        return sorted(python_files)
 
     def _run_command(self, command: List[str], description: str) -> bool:
         """
@@ -56,78 +72,166 @@ class LintFormatter:
         """
         print(f"Running {description}...")
         try:
-            result = subprocess.run(
+            # Merge stderr into stdout and echo each line as it arrives, so
+            # long runs show progress and output is never held in memory
+            with subprocess.Popen(
                 command,
                 cwd=self.project_root,
-                capture_output=True,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
                 text=True,
-                check=True,
-            )
-            print(f"✅ {description} completed successfully")
-            if result.stdout:
-                print(f"Output: {result.stdout}")
-            return True
-        except subprocess.CalledProcessError as e:
-            print(f"❌ {description} failed with exit code {e.returncode}")
-            if e.stdout:
-                print(f"STDOUT: {e.stdout}")
-            if e.stderr:
-                print(f"STDERR: {e.stderr}")
-            return False
+                bufsize=1,
+            ) as process:
+                for line in process.stdout:
+                    print(line, end="")
+                returncode = process.wait()
         except FileNotFoundError:
             print("❌ Command not found. Please install the required tool.")
             return False
 
+        if returncode != 0:
+            print(f"❌ {description} failed with exit code {returncode}")
+            return False
+
+        print(f"✅ {description} completed successfully")
+        return True
+
+    def _run_in_process(self, check: Callable[[], bool], description: str) -> bool:
+        """
+        Run a tool through its Python API and report like _run_command.
+
+        Args:
+            check: Runs the tool and returns True on success
+            description: Description of what the tool does
+
+        Returns:
+            True if the tool succeeded, False otherwise
+        """
+        print(f"Running {description}...")
+        try:
+            succeeded = check()
+        except Exception as e:
+            print(f"❌ {description} failed: {e}")
+            return False
+
+        if succeeded:
+            print(f"✅ {description} completed successfully")
+        else:
+            print(f"❌ {description} reported problems")
+        return succeeded
+
     def format_with_black(self, check_only: bool = False) -> bool:
         """
         Format code using black formatter.
 
+        Runs black in-process when it is importable, avoiding the start-up
+        cost of a separate interpreter, and falls back to the black command.
+
         Args:
             check_only: If True, only check formatting without making changes
 
         Returns:
             True if formatting succeeded or code is already formatted
         """
-        command = ["black", "--line-length", "88"]
-        if check_only:
-            command.append("--check")
-        command.extend([str(f) for f in self.python_files])
-
-        return self._run_command(command, "Black code formatting")
+        try:
+            import black
+        except ImportError:
+            command = ["black", "--line-length", "88"]
+            if check_only:
+                command.append("--check")
+            command.extend(self.python_file_strs)
+
+            return self._run_command(command, "Black code formatting")
+
+        mode = black.Mode(line_length=88)
+        write_back = black.WriteBack.CHECK if check_only else black.WriteBack.YES
+
+        def run() -> bool:
+            changed = [
+                path
+                for path in self.python_files
+                if black.format_file_in_place(
+                    path, fast=False, mode=mode, write_back=write_back
+                )
+            ]
+            verb = "would reformat" if check_only else "reformatted"
+            for path in changed:
+                print(f"{verb} {path}")
+            return not (check_only and changed)
+
+        return self._run_in_process(run, "Black code formatting")
 
     def sort_imports_with_isort(self, check_only: bool = False) -> bool:
         """
         Sort imports using isort.
 
+        Runs isort in-process when it is importable and falls back to the
+        isort command.
+
         Args:
             check_only: If True, only check import order without making changes
 
         Returns:
             True if import sorting succeeded or imports are already sorted
         """
-        command = ["isort", "--profile", "black"]
-        if check_only:
-            command.append("--check-only")
-        command.extend([str(f) for f in self.python_files])
+        try:
+            import isort
+        except ImportError:
+            command = ["isort", "--profile", "black"]
+            if check_only:
+                command.append("--check-only")
+            command.extend(self.python_file_strs)
+
+            return self._run_command(command, "Import sorting with isort")
+
+        config = isort.Config(profile="black")
+
+        def run() -> bool:
+            if check_only:
+                # Evaluate every file so all problems are reported at once
+                results = [
+                    isort.check_file(path, config=config) for path in self.python_files
+                ]
+                return all(results)
+            for path in self.python_files:
+                isort.file(path, config=config)
+            return True
 
-        return self._run_command(command, "Import sorting with isort")
+        return self._run_in_process(run, "Import sorting with isort")
 
     def lint_with_flake8(self) -> bool:
         """
         Lint code using flake8.
 
+        Runs flake8 in-process through its legacy API when it is importable
+        and falls back to the flake8 command.
+
         Returns:
             True if linting passed without errors
         """
-        command = [
-            "flake8",
-            "--max-line-length=88",
-            "--extend-ignore=E203,W503,E501",  # Compatible with black
-            "--exclude=venv,__pycache__,.git",
-        ]
-        command.extend([str(f) for f in self.python_files])
+        try:
+            from flake8.api import legacy as flake8
+        except ImportError:
+            command = [
+                "flake8",
+                "--max-line-length=88",
+                "--extend-ignore=E203,W503,E501",  # Compatible with black
+                "--exclude=venv,__pycache__,.git",
+            ]
+            command.extend(self.python_file_strs)
+
+            return self._run_command(command, "Code linting with flake8")
+
+        def run() -> bool:
+            style_guide = flake8.get_style_guide(
+                max_line_length=88,
+                extend_ignore=["E203", "W503", "E501"],  # Compatible with black
+                exclude=["venv", "__pycache__", ".git"],
+            )
+            report = style_guide.check_files(self.python_file_strs)
+            return report.total_errors == 0
 
-        return self._run_command(command, "Code linting with flake8")
+        return self._run_in_process(run, "Code linting with flake8")
 
     def lint_with_pylint(self) -> bool:
         """
@@ -141,7 +245,7 @@ class LintFormatter:
             "--disable=C0114,C0116",  # Disable docstring warnings
             "--max-line-length=88",
         ]
-        command.extend([str(f) for f in self.python_files])
+        command.extend(self.python_file_strs)
 
         return self._run_command(command, "Code analysis with pylint")
 
@@ -160,18 +264,27 @@ class LintFormatter:
         print(f"Files to process: {[f.name for f in self.python_files]}")
         print("-" * 50)
 
-        success = True
+        if check_only:
+            # The checks only read the files, so run them side by side
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                checks = [
+                    executor.submit(self.sort_imports_with_isort, True),
+                    executor.submit(self.format_with_black, True),
+                ]
+                success = all([check.result() for check in checks])
+        else:
+            success = True
 
-        # Sort imports first
-        if not self.sort_imports_with_isort(check_only):
-            success = False
+            # Sort imports first. Each step rewrites the files the next one
+            # reads, so these stay sequential.
+            if not self.sort_imports_with_isort(check_only):
+                success = False
 
-        # Format code with black
-        if not self.format_with_black(check_only):
-            success = False
+            # Format code with black
+            if not self.format_with_black(check_only):
+                success = False
 
-        # Lint with flake8 (only if not in check-only mode)
-        if not check_only:
+            # Lint with flake8 (only if not in check-only mode)
             if not self.lint_with_flake8():
                 success = False
 
@@ -199,10 +312,20 @@ class LintFormatter:
         ]
 
         print("Installing linting and formatting dependencies...")
-        for dep in dependencies:
-            command = [sys.executable, "-m", "pip", "install", dep]
-            if not self._run_command(command, f"Installing {dep}"):
-                return False
+
+        # One pip run resolves and downloads everything together instead of
+        # starting pip and fetching the index once per package
+        command = [
+            sys.executable,
+            "-m",
+            "pip",
+            "install",
+            "--disable-pip-version-check",
+            "--no-input",
+            *dependencies,
+        ]
+        if not self._run_command(command, f"Installing {', '.join(dependencies)}"):
+            return False
 
         print("✅ All dependencies installed successfully!")
         return True
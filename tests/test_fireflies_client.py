@@ -0,0 +1,75 @@
+"""Tests for the Fireflies API client."""
+
+import json
+import unittest
+from typing import Any, Dict, List
+
+from fireflies_client import FirefliesAPIError, FirefliesClient
+
+
+class FakeResponse:
+    """Minimal stand-in for requests.Response."""
+
+    def __init__(self, body: Dict[str, Any], status_code: int = 200):
+        self.status_code = status_code
+        self.content = json.dumps(body).encode("utf-8")
+        self.text = self.content.decode("utf-8")
+
+
+class FakeSession:
+    """Session that returns canned responses and records the payloads sent."""
+
+    def __init__(self, responses: List[FakeResponse]):
+        self.headers: Dict[str, str] = {}
+        self.responses = list(responses)
+        self.payloads: List[Dict[str, Any]] = []
+
+    def post(self, url: str, data: bytes, timeout: float) -> FakeResponse:
+        self.payloads.append(json.loads(data))
+        return self.responses.pop(0)
+
+    def close(self) -> None:
+        pass
+
+
+def make_client(*responses: FakeResponse) -> FirefliesClient:
+    return FirefliesClient(
+        "x" * 32, "https://api.example.com/graphql", session=FakeSession(responses)
+    )
+
+
+class FetchTranscriptDetailsTest(unittest.TestCase):
+    def test_returns_transcript(self):
+        client = make_client(
+            FakeResponse({"data": {"transcript": {"id": "t1", "sentences": []}}})
+        )
+
+        transcript = client.fetch_transcript_details("t1", include={"sentences"})
+
+        self.assertEqual(transcript["id"], "t1")
+
+    def test_errors_with_partial_data_raise(self):
+        # A truncated transcript comes back as partial data plus errors; it
+        # must not be mistaken for a complete one
+        client = make_client(
+            FakeResponse(
+                {
+                    "data": {"transcript": {"id": "t1", "sentences": [{"text": "a"}]}},
+                    "errors": [
+                        {
+                            "message": "Internal error",
+                            "extensions": {"code": "INTERNAL_SERVER_ERROR"},
+                        }
+                    ],
+                }
+            )
+        )
+
+        with self.assertRaises(FirefliesAPIError) as context:
+            client.fetch_transcript_details("t1")
+
+        self.assertEqual(context.exception.error_code, "INTERNAL_SERVER_ERROR")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,68 @@
+"""Tests for the transcript formatter."""
+
+import json
+import tempfile
+import threading
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from transcript_formatter import TranscriptFormatter
+
+
+def make_transcript(index: int) -> dict:
+    return {
+        "id": f"t{index}",
+        "title": "Weekly Sync",
+        "sentences": [{"text": f"Body {index}", "speaker_name": "Ann"}],
+    }
+
+
+class ConcurrentSaveTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.output = Path(self.directory.name)
+        self.formatter = TranscriptFormatter(self.directory.name)
+
+    def tearDown(self):
+        self.formatter.close()
+        self.directory.cleanup()
+
+    def test_colliding_titles_get_distinct_files(self):
+        count = 40
+        workers = 8
+        barrier = threading.Barrier(workers)
+
+        def save(index: int) -> Path:
+            # Start the first saves together so their names collide
+            if index < workers:
+                barrier.wait()
+            return self.formatter.save_transcript(make_transcript(index))
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            paths = list(executor.map(save, range(count)))
+
+        self.assertEqual(len(set(paths)), count)
+        self.assertEqual(len(list(self.output.glob("*.md"))), count)
+        for index, path in enumerate(paths):
+            self.assertIn(f"Body {index}", path.read_text(encoding="utf-8"))
+
+        self.formatter.flush_index()
+        index = json.loads((self.output / ".fireflies_index.json").read_text())
+        self.assertEqual(index, {f"t{i}": path.name for i, path in enumerate(paths)})
+
+    def test_existing_file_is_not_overwritten(self):
+        first = self.formatter.save_transcript(make_transcript(0))
+
+        # Created behind the formatter's back, after its directory scan
+        taken = first.with_name(first.stem + "_1.md")
+        taken.write_text("keep me", encoding="utf-8")
+
+        second = self.formatter.save_transcript(make_transcript(1))
+
+        self.assertEqual(taken.read_text(encoding="utf-8"), "keep me")
+        self.assertNotIn(second, (first, taken))
+
+
+if __name__ == "__main__":
+    unittest.main()
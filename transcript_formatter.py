@@ -5,13 +5,110 @@ This module handles the conversion of Fireflies API transcript data into
 well-formatted markdown files with proper metadata and content structure.
 """
 
+import atexit
+import functools
 import logging
-import re
-from datetime import datetime
+import os
+import threading
+import time
+import weakref
+from itertools import chain
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Set
 import json
 
+from config import parse_iso_datetime
+
+try:
+    import orjson
+except ImportError:  # orjson is an optional speed-up
+    orjson = None
+
+# JSON helpers for the transcript ID index. orjson is several times faster
+# than the stdlib for large indexes; both variants work on bytes and produce
+# sorted, two-space indented output.
+if orjson is not None:
+
+    def _index_dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS | orjson.OPT_INDENT_2)
+
+    _index_loads = orjson.loads
+else:
+
+    def _index_dumps(obj: Any) -> bytes:
+        return json.dumps(obj, indent=2, sort_keys=True).encode("utf-8")
+
+    _index_loads = json.loads
+
+# Number of transcripts recorded between index writes. Unwritten entries are
+# flushed by flush_index()/close() and at interpreter exit, so this only
+# bounds what a hard crash could lose: those transcripts are downloaded again
+# and saved next to their first copy under a numbered name. Long-running
+# callers should call flush_index() at natural checkpoints.
+_INDEX_FLUSH_INTERVAL = 50
+
+# Formatters that have not been closed yet. Weak references, so a formatter
+# that is never closed can still be garbage collected.
+_open_formatters: "weakref.WeakSet[TranscriptFormatter]" = weakref.WeakSet()
+
+
+@atexit.register
+def _flush_open_formatters() -> None:
+    """Write pending index entries of formatters still open at exit."""
+    for formatter in list(_open_formatters):
+        formatter.flush_index()
+
+
+# Maps characters that are not allowed in filenames on common platforms
+# to underscores, for use with str.translate
+_INVALID_FILENAME_CHARS = str.maketrans(dict.fromkeys('<>:"/\\|?*!', "_"))
+
+# Drops "*" and escapes "_" in speaker names so they can't break the bold
+# markdown around them
+_SPEAKER_MARKDOWN_CHARS = str.maketrans({"*": None, "_": "\\_"})
+
+# Summary fields rendered by format_summary, in order, with their headings
+_SUMMARY_FIELDS = (
+    ("action_items", "Action Items"),
+    ("keywords", "Keywords"),
+    ("outline", "Outline"),
+)
+
+
+# format_duration and format_date are pure functions of their input, so their
+# results are memoized here and shared by all formatter instances.
+@functools.lru_cache(maxsize=1024)
+def _format_duration(duration_minutes: Optional[float]) -> str:
+    """Implementation of TranscriptFormatter.format_duration."""
+    if not duration_minutes:
+        return "Unknown"
+
+    try:
+        duration = float(duration_minutes)
+        hours = int(duration // 60)
+        minutes = int(duration % 60)
+
+        if hours > 0:
+            return f"{hours}h {minutes}m"
+        else:
+            return f"{minutes}m"
+    except (ValueError, TypeError):
+        return "Unknown"
+
+
+@functools.lru_cache(maxsize=1024)
+def _format_date(date_string: Optional[str]) -> str:
+    """Implementation of TranscriptFormatter.format_date."""
+    if not date_string:
+        return "Unknown"
+
+    try:
+        # Parse ISO 8601 date
+        dt = parse_iso_datetime(date_string)
+        return dt.strftime("%B %d, %Y at %I:%M %p UTC")
+    except (ValueError, TypeError, AttributeError):
+        return date_string  # Return original if parsing fails
+
 
 class TranscriptFormatter:
     """
@@ -41,14 +138,36 @@ class TranscriptFormatter:
         # previous runs, so we can skip redundant API calls.
         self._id_index: Dict[str, str] = {}
         self._index_loaded: bool = False
+
+        # Names of the files present in the output directory, captured with a
+        # single directory scan when the index is loaded. A transcript only
+        # counts as saved if its indexed file is still here.
+        self._existing_files: Set[str] = set()
+
+        # Cached timestamp for _default_filename and the second it is for
+        self._timestamp = ""
+        self._timestamp_second: Optional[int] = None
         self._index_file = self.output_directory / ".fireflies_index.json"
 
+        # Number of index entries recorded since the index was last written
+        self._unsaved_index_entries = 0
+
+        # Total size of the transcript files written by this formatter
+        self.bytes_written = 0
+
+        # Guards the index and the set of existing filenames, so transcripts
+        # can be saved from several threads (main.py's writer pool)
+        self._index_lock = threading.RLock()
+
         # Ensure output directory exists
         self.output_directory.mkdir(parents=True, exist_ok=True)
 
+        # Write any pending index entries even if close() is never called
+        _open_formatters.add(self)
+
         self.logger.info(
-            f"TranscriptFormatter initialized with output directory: "
-            f"{self.output_directory}"
+            "TranscriptFormatter initialized with output directory: %s",
+            self.output_directory,
         )
 
     def _load_index(self) -> None:
@@ -59,22 +178,32 @@ class TranscriptFormatter:
         we have already written for them. This is intentionally lazy-loaded
         so that normal runs only pay the cost once.
         """
-        if self._index_loaded:
-            return
+        with self._index_lock:
+            if not self._index_loaded:
+                self._load_index_locked()
 
+    def _load_index_locked(self) -> None:
+        """Load the index and scan the output directory; needs _index_lock."""
         if self._index_file.exists():
             try:
-                with open(self._index_file, "r", encoding="utf-8") as f:
-                    data = json.load(f)
+                data = _index_loads(self._index_file.read_bytes())
                 if isinstance(data, dict):
                     # Ensure keys and values are strings
                     self._id_index = {str(k): str(v) for k, v in data.items()}
             except Exception as exc:
                 self.logger.warning(
-                    f"Failed to load transcript index '{self._index_file}': {exc}"
+                    "Failed to load transcript index '%s': %s", self._index_file, exc
                 )
                 self._id_index = {}
 
+        try:
+            with os.scandir(self.output_directory) as entries:
+                self._existing_files = {entry.name for entry in entries}
+        except OSError as exc:
+            self.logger.warning(
+                "Failed to scan output directory '%s': %s", self.output_directory, exc
+            )
+
         self._index_loaded = True
 
     def _save_index(self) -> None:
@@ -82,14 +211,18 @@ class TranscriptFormatter:
         Persist the transcript ID index to disk.
 
         The file lives alongside the markdown transcripts and is safe to
-        delete; it will simply be re-created on the next run.
+        delete; it will simply be re-created on the next run. It is written
+        to a temporary file and renamed into place, so an interrupted run
+        never leaves a truncated index behind.
         """
+        tmp_file = self._index_file.with_name(self._index_file.name + ".tmp")
         try:
-            with open(self._index_file, "w", encoding="utf-8") as f:
-                json.dump(self._id_index, f, indent=2, sort_keys=True)
+            with open(tmp_file, "wb") as f:
+                f.write(_index_dumps(self._id_index))
+            os.replace(tmp_file, self._index_file)
         except Exception as exc:
             self.logger.warning(
-                f"Failed to save transcript index '{self._index_file}': {exc}"
+                "Failed to save transcript index '%s': %s", self._index_file, exc
             )
 
     def is_transcript_already_saved(self, transcript_id: Optional[str]) -> bool:
@@ -97,13 +230,33 @@ class TranscriptFormatter:
         Check whether we have already saved a transcript with this ID.
 
         This is used by the main fetcher to avoid calling the detailed
-        transcript API for meetings that are already on disk.
+        transcript API for meetings that are already on disk. Transcripts
+        whose markdown file has since been deleted are downloaded again.
         """
         if not transcript_id:
             return False
 
         self._load_index()
-        return transcript_id in self._id_index
+        return self._id_index.get(transcript_id) in self._existing_files
+
+    def filter_unsaved_transcripts(
+        self, transcripts: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Diff a transcript list against the saved-transcript index.
+
+        Args:
+            transcripts: Transcript metadata from the API list query
+
+        Returns:
+            The transcripts that have not been saved yet, in their original order
+        """
+        self._load_index()
+        return [
+            transcript
+            for transcript in transcripts
+            if not self.is_transcript_already_saved(transcript.get("id"))
+        ]
 
     def record_transcript_saved(
         self, transcript_id: Optional[str], file_path: Path
@@ -119,8 +272,44 @@ class TranscriptFormatter:
             return
 
         self._load_index()
-        self._id_index[transcript_id] = file_path.name
-        self._save_index()
+        with self._index_lock:
+            self._id_index[transcript_id] = file_path.name
+
+            # Rewriting the whole index after every transcript is quadratic
+            # in the number of transcripts, so it is written in batches.
+            self._unsaved_index_entries += 1
+            if self._unsaved_index_entries >= _INDEX_FLUSH_INTERVAL:
+                self.flush_index()
+
+    def flush_index(self) -> None:
+        """Write the transcript ID index to disk if it has unsaved entries."""
+        with self._index_lock:
+            if self._unsaved_index_entries:
+                self._save_index()
+                self._unsaved_index_entries = 0
+
+    def close(self) -> None:
+        """Flush the transcript ID index; call once done saving transcripts."""
+        self.flush_index()
+        _open_formatters.discard(self)
+
+    def _default_filename(self) -> str:
+        """
+        Build the timestamped filename used for meetings without a usable title.
+
+        The formatted timestamp only changes once a second, so it is cached
+        and reused for untitled meetings saved within the same second.
+
+        Returns:
+            Filename like "meeting_20240101_093000" (without extension)
+        """
+        second = int(time.time())
+        if second != self._timestamp_second:
+            # Timestamp first, so other threads never pair the new second
+            # with the previous timestamp
+            self._timestamp = time.strftime("%Y%m%d_%H%M%S", time.localtime(second))
+            self._timestamp_second = second
+        return f"meeting_{self._timestamp}"
 
     def sanitize_filename(self, title: str, max_length: int = 100) -> str:
         """
@@ -135,22 +324,24 @@ class TranscriptFormatter:
         """
         if not title or not title.strip():
             # Generate a default filename with timestamp
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            return f"meeting_{timestamp}"
+            return self._default_filename()
 
         # Remove or replace invalid characters
-        sanitized = re.sub(r'[<>:"/\\|?*!]', "_", title.strip())
+        sanitized = title.strip().translate(_INVALID_FILENAME_CHARS)
 
-        # Replace multiple spaces/underscores with single underscore
-        sanitized = re.sub(r"[_\s]+", "_", sanitized)
+        # Replace multiple spaces/underscores with single underscore. split()
+        # breaks on runs of any Unicode whitespace, the same set as \s;
+        # splitting on "_" and dropping empty pieces collapses underscore
+        # runs (leading/trailing ones are stripped below anyway).
+        sanitized = "_".join(sanitized.split())
+        sanitized = "_".join(filter(None, sanitized.split("_")))
 
         # Remove leading/trailing underscores and dots
         sanitized = sanitized.strip("_.")
 
         # Ensure it's not empty after sanitization
         if not sanitized:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            return f"meeting_{timestamp}"
+            return self._default_filename()
 
         # Truncate if too long
         if len(sanitized) > max_length:
@@ -168,19 +359,9 @@ class TranscriptFormatter:
         Returns:
             Formatted duration string
         """
-        if not duration_minutes:
-            return "Unknown"
-
         try:
-            duration = float(duration_minutes)
-            hours = int(duration // 60)
-            minutes = int(duration % 60)
-
-            if hours > 0:
-                return f"{hours}h {minutes}m"
-            else:
-                return f"{minutes}m"
-        except (ValueError, TypeError):
+            return _format_duration(duration_minutes)
+        except TypeError:  # Unhashable value, which can't be a duration
             return "Unknown"
 
     def format_date(self, date_string: Optional[str]) -> str:
@@ -193,15 +374,10 @@ class TranscriptFormatter:
         Returns:
             Formatted date string
         """
-        if not date_string:
-            return "Unknown"
-
         try:
-            # Parse ISO 8601 date
-            dt = datetime.fromisoformat(date_string.replace("Z", "+00:00"))
-            return dt.strftime("%B %d, %Y at %I:%M %p UTC")
-        except (ValueError, AttributeError):
-            return date_string  # Return original if parsing fails
+            return _format_date(date_string)
+        except TypeError:  # Unhashable value, returned as is like other bad input
+            return date_string
 
     def format_participants(
         self, participants: List[str], fireflies_users: List[str]
@@ -225,8 +401,9 @@ class TranscriptFormatter:
         if not isinstance(fireflies_users, list):
             fireflies_users = []
 
-        # Combine and deduplicate participants
-        all_participants = list(set(participants + fireflies_users))
+        # Combine and deduplicate participants, keeping first-seen order so
+        # the output is the same on every run
+        all_participants = list(dict.fromkeys(chain(participants, fireflies_users)))
 
         if len(all_participants) <= 5:
             return ", ".join(all_participants)
@@ -249,29 +426,33 @@ class TranscriptFormatter:
         if not sentences:
             return "No transcript content available."
 
+        # This runs once per sentence, so keep the loop body lean: bind the
+        # append method locally and build each line with a single f-string.
         formatted_content = []
+        append = formatted_content.append
+
+        # A handful of speakers repeat across all sentences, so each name is
+        # sanitized once and looked up afterwards
+        speaker_cache: Dict[str, str] = {}
 
         for sentence in sentences:
-            # Extract sentence data
             text = sentence.get("text", "").strip()
-            speaker_name = sentence.get("speaker_name", "Unknown Speaker")
-            start_time = sentence.get("start_time", 0)
 
             # Skip empty sentences
             if not text:
                 continue
 
-            # Format timestamp
-            minutes = int(start_time // 60)
-            seconds = int(start_time % 60)
-            timestamp = f"[{minutes:02d}:{seconds:02d}]"
+            # Timestamp as [MM:SS] from the start time in seconds
+            minutes, seconds = divmod(sentence.get("start_time", 0), 60)
 
-            # Format speaker name (sanitize for markdown)
-            speaker_clean = speaker_name.replace("*", "").replace("_", "\\_")
+            # Speaker name sanitized for markdown
+            raw_speaker = sentence.get("speaker_name", "Unknown Speaker")
+            speaker = speaker_cache.get(raw_speaker)
+            if speaker is None:
+                speaker = raw_speaker.translate(_SPEAKER_MARKDOWN_CHARS)
+                speaker_cache[raw_speaker] = speaker
 
-            # Create formatted line
-            formatted_line = f"**{timestamp} {speaker_clean}**: {text}"
-            formatted_content.append(formatted_line)
+            append(f"**[{int(minutes):02d}:{int(seconds):02d}] {speaker}**: {text}")
 
         return "\n\n".join(formatted_content)
 
@@ -288,22 +469,17 @@ class TranscriptFormatter:
         if not summary:
             return "No summary available."
 
-        summary_parts = []
-
-        # Action items
-        action_items = summary.get("action_items")
-        if action_items and isinstance(action_items, str) and action_items.strip():
-            summary_parts.append(f"**Action Items:**\n{action_items}")
+        values = [(summary.get(key), heading) for key, heading in _SUMMARY_FIELDS]
 
-        # Keywords
-        keywords = summary.get("keywords")
-        if keywords and isinstance(keywords, str) and keywords.strip():
-            summary_parts.append(f"**Keywords:**\n{keywords}")
+        # Short meetings often come back with every field empty
+        if not any(value for value, _ in values):
+            return "No summary details available."
 
-        # Outline
-        outline = summary.get("outline")
-        if outline and isinstance(outline, str) and outline.strip():
-            summary_parts.append(f"**Outline:**\n{outline}")
+        summary_parts = [
+            f"**{heading}:**\n{value}"
+            for value, heading in values
+            if value and isinstance(value, str) and value.strip()
+        ]
 
         if not summary_parts:
             return "No summary details available."
@@ -335,44 +511,31 @@ class TranscriptFormatter:
         formatted_duration = self.format_duration(duration)
         formatted_participants = self.format_participants(participants, fireflies_users)
 
-        # Build markdown content
-        markdown_parts = []
-
-        # Title
-        markdown_parts.append(f"# {title}")
-        markdown_parts.append("")
-
-        # Metadata section
-        markdown_parts.append("## Meeting Details")
-        markdown_parts.append("")
-        markdown_parts.append(f"**Date**: {formatted_date}")
-        markdown_parts.append(f"**Duration**: {formatted_duration}")
-        markdown_parts.append(f"**Organizer**: {organizer_email}")
-        markdown_parts.append(f"**Participants**: {formatted_participants}")
+        # Optional sections
+        link_line = f"\n**Fireflies Link**: {transcript_url}" if transcript_url else ""
 
-        if transcript_url:
-            markdown_parts.append(f"**Fireflies Link**: {transcript_url}")
-
-        markdown_parts.append("")
-
-        # Summary section
         summary = transcript_data.get("summary")
-        if summary:
-            formatted_summary = self.format_summary(summary)
-            markdown_parts.append("## Meeting Summary")
-            markdown_parts.append("")
-            markdown_parts.append(formatted_summary)
-            markdown_parts.append("")
-
-        # Transcript section
-        markdown_parts.append("## Transcript")
-        markdown_parts.append("")
+        summary_section = (
+            f"## Meeting Summary\n\n{self.format_summary(summary)}\n\n"
+            if summary
+            else ""
+        )
 
         sentences = transcript_data.get("sentences", [])
         formatted_transcript = self.format_transcript_sentences(sentences)
-        markdown_parts.append(formatted_transcript)
 
-        return "\n".join(markdown_parts)
+        # Build the whole document in one string
+        return (
+            f"# {title}\n\n"
+            f"## Meeting Details\n\n"
+            f"**Date**: {formatted_date}\n"
+            f"**Duration**: {formatted_duration}\n"
+            f"**Organizer**: {organizer_email}\n"
+            f"**Participants**: {formatted_participants}{link_line}\n\n"
+            f"{summary_section}"
+            f"## Transcript\n\n"
+            f"{formatted_transcript}"
+        )
 
     def save_transcript(
         self, transcript_data: Dict[str, Any], filename_override: Optional[str] = None
@@ -405,10 +568,29 @@ class TranscriptFormatter:
             # Create file path
             file_path = self.output_directory / filename
 
-            # Handle duplicate filenames
+            # Create markdown content, encoded once for a binary write
+            markdown_bytes = self.create_markdown_content(transcript_data).encode(
+                "utf-8"
+            )
+
+            # Handle duplicate filenames. Names known from the directory
+            # listing taken when the index was loaded are skipped without a
+            # syscall; the exclusive create then atomically refuses any file
+            # that appeared since, so an existing file is never overwritten.
+            self._load_index()
             counter = 1
             original_path = file_path
-            while file_path.exists():
+            while True:
+                if file_path.name not in self._existing_files:
+                    try:
+                        fd = os.open(
+                            file_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o644
+                        )
+                        break
+                    except FileExistsError:
+                        with self._index_lock:
+                            self._existing_files.add(file_path.name)
+
                 name_without_ext = original_path.stem
                 extension = original_path.suffix
                 file_path = (
@@ -416,23 +598,23 @@ class TranscriptFormatter:
                 )
                 counter += 1
 
-            # Create markdown content
-            markdown_content = self.create_markdown_content(transcript_data)
-
             # Write file
-            with open(file_path, "w", encoding="utf-8") as f:
-                f.write(markdown_content)
+            with os.fdopen(fd, "wb") as f:
+                f.write(markdown_bytes)
+            with self._index_lock:
+                self._existing_files.add(file_path.name)
+                self.bytes_written += len(markdown_bytes)
 
             # Update the on-disk index so future runs know this
             # transcript ID has already been downloaded.
             transcript_id = transcript_data.get("id")
             self.record_transcript_saved(transcript_id, file_path)
 
-            self.logger.info(f"Saved transcript: {file_path}")
+            self.logger.info("Saved transcript: %s", file_path)
             return file_path
 
         except Exception as e:
-            self.logger.error(f"Failed to save transcript: {str(e)}")
+            self.logger.error("Failed to save transcript: %s", e)
             raise OSError(f"Could not save transcript file: {str(e)}")
 
     def get_output_directory(self) -> Path:
@@ -444,6 +626,23 @@ class TranscriptFormatter:
         """
         return self.output_directory
 
+    def _scan_saved_transcripts(self) -> List[os.DirEntry]:
+        """
+        Scan the output directory for transcript files in one pass.
+
+        Returns:
+            Directory entries of the markdown files, sorted by name
+        """
+        with os.scandir(self.output_directory) as entries:
+            return sorted(
+                (
+                    entry
+                    for entry in entries
+                    if entry.name.endswith(".md") and entry.is_file()
+                ),
+                key=lambda entry: entry.name,
+            )
+
     def list_saved_transcripts(self) -> List[Path]:
         """
         List all saved transcript files in the output directory.
@@ -452,10 +651,9 @@ class TranscriptFormatter:
             List of Path objects for saved transcript files
         """
         try:
-            transcript_files = list(self.output_directory.glob("*.md"))
-            return sorted(transcript_files)
+            return [Path(entry.path) for entry in self._scan_saved_transcripts()]
         except Exception as e:
-            self.logger.error(f"Failed to list transcript files: {str(e)}")
+            self.logger.error("Failed to list transcript files: %s", e)
             return []
 
     def get_file_stats(self) -> Dict[str, Any]:
@@ -466,17 +664,25 @@ class TranscriptFormatter:
             Dictionary with file statistics
         """
         try:
-            files = self.list_saved_transcripts()
-            total_size = sum(f.stat().st_size for f in files if f.exists())
+            # The scan already knows the file types, so each file needs a
+            # single stat call for its size
+            files = self._scan_saved_transcripts()
+            total_size = 0
+            for entry in files:
+                try:
+                    total_size += entry.stat().st_size
+                except FileNotFoundError:
+                    # Deleted since the directory was scanned
+                    pass
 
             return {
                 "total_files": len(files),
                 "total_size_bytes": total_size,
                 "total_size_mb": round(total_size / (1024 * 1024), 2),
-                "files": [f.name for f in files],
+                "files": [entry.name for entry in files],
             }
         except Exception as e:
-            self.logger.error(f"Failed to get file stats: {str(e)}")
+            self.logger.error("Failed to get file stats: %s", e)
             return {
                 "total_files": 0,
                 "total_size_bytes": 0,